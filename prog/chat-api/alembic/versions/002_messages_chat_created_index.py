@@ -0,0 +1,36 @@
+"""Replace message indexes with composite (chat_id, created_at DESC, id DESC)
+
+Revision ID: 002_messages_chat_created
+Revises: 001_initial
+Create Date: 2026-10-15 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '002_messages_chat_created'
+down_revision: Union[str, None] = '001_initial'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create composite messages index and drop the single-column ones."""
+    op.create_index(
+        'idx_messages_chat_created',
+        'messages',
+        ['chat_id', sa.text('created_at DESC'), sa.text('id DESC')]
+    )
+    op.drop_index('idx_messages_created_at', table_name='messages')
+    op.drop_index('idx_messages_chat_id', table_name='messages')
+
+
+def downgrade() -> None:
+    """Restore single-column messages indexes."""
+    op.create_index('idx_messages_chat_id', 'messages', ['chat_id'])
+    op.create_index('idx_messages_created_at', 'messages', ['created_at'])
+    op.drop_index('idx_messages_chat_created', table_name='messages')
@@ -2,6 +2,8 @@
 Database configuration and session management.
 Uses async SQLAlchemy 2.0 with asyncpg driver.
 """
+import asyncio
+
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
 
@@ -13,7 +15,14 @@ engine = create_async_engine(
     settings.DATABASE_URL,
     echo=False,  # Set to True for SQL query logging
     future=True,
-    pool_pre_ping=True,  # Verify connections before using
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    # Behind PgBouncer (transaction mode) pre-ping stays disabled; stale
+    # connections are rotated by pool_recycle instead.
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+    # A hung statement must not hold a pooled connection indefinitely
+    connect_args={"command_timeout": settings.DB_COMMAND_TIMEOUT},
 )
 
 # Create async session factory
@@ -53,3 +62,17 @@ async def get_db() -> AsyncSession:
             raise
         finally:
             await session.close()
+
+
+async def warm_up_pool() -> None:
+    """
+    Open pool_size connections concurrently and return them to the pool.
+    
+    The pool creates connections lazily, so without warm-up the first
+    requests after startup pay for connection setup.
+    """
+    async def checkout() -> None:
+        async with engine.connect():
+            pass
+    
+    await asyncio.gather(*(checkout() for _ in range(settings.DB_POOL_SIZE)))
@@ -6,11 +6,14 @@ import sys
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request, status
-from fastapi.responses import JSONResponse
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import ORJSONResponse
 from fastapi.exceptions import RequestValidationError
+from fastapi.middleware.gzip import GZipMiddleware
 from sqlalchemy.exc import SQLAlchemyError
 
 from app.config import settings
+from app.database import warm_up_pool
 from app.routers import chats_router
 from app.exceptions import ChatNotFoundException
 
@@ -38,6 +41,15 @@ async def lifespan(app: FastAPI):
     logger.info(f"Log level: {settings.LOG_LEVEL}")
     logger.info(f"Database URL: {settings.DATABASE_URL.split('@')[-1]}")  # Hide credentials
     
+    try:
+        await warm_up_pool()
+        logger.info(f"Database pool warmed up with {settings.DB_POOL_SIZE} connections")
+    except Exception as e:
+        # Not fatal: connections will be opened on demand. asyncpg server
+        # errors (unknown database or role) are not wrapped by SQLAlchemy,
+        # so anything raised here is only logged.
+        logger.warning(f"Database pool warm-up failed: {str(e)}")
+    
     yield
     
     # Shutdown
@@ -49,16 +61,21 @@ app = FastAPI(
     title=settings.PROJECT_NAME,
     description="REST API for managing chats and messages",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 
+# Compress larger responses (chat with up to 100 messages of 5000 chars)
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
+
 # Exception handlers
 @app.exception_handler(ChatNotFoundException)
 async def chat_not_found_handler(request: Request, exc: ChatNotFoundException):
     """Handle ChatNotFoundException."""
     logger.warning(f"Chat not found: {exc.detail}")
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={"detail": exc.detail}
     )
@@ -68,9 +85,9 @@ async def chat_not_found_handler(request: Request, exc: ChatNotFoundException):
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     """Handle Pydantic validation errors."""
     logger.warning(f"Validation error: {exc.errors()}")
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-        content={"detail": exc.errors()}
+        content={"detail": jsonable_encoder(exc.errors())}
     )
 
 
@@ -78,7 +95,7 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
 async def sqlalchemy_exception_handler(request: Request, exc: SQLAlchemyError):
     """Handle SQLAlchemy database errors."""
     logger.error(f"Database error: {str(exc)}")
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={"detail": "Internal server error"}
     )
@@ -88,7 +105,7 @@ async def sqlalchemy_exception_handler(request: Request, exc: SQLAlchemyError):
 async def general_exception_handler(request: Request, exc: Exception):
     """Handle all other exceptions."""
     logger.error(f"Unexpected error: {str(exc)}", exc_info=True)
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={"detail": "Internal server error"}
     )
@@ -111,7 +128,6 @@ async def health_check():
 
 
 # Request logging middleware
-@app.middleware("http")
 async def log_requests(request: Request, call_next):
     """
     Log all incoming requests.
@@ -127,3 +143,8 @@ async def log_requests(request: Request, call_next):
     response = await call_next(request)
     logger.info(f"Response status: {response.status_code}")
     return response
+
+
+# Access logging is left to uvicorn; per-request app logging only in debug mode
+if settings.LOG_LEVEL == "DEBUG":
+    app.middleware("http")(log_requests)
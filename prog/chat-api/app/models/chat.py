@@ -3,6 +3,7 @@ SQLAlchemy models for Chat and Message entities.
 """
 from datetime import datetime
 from sqlalchemy import String, Integer, ForeignKey, DateTime, Index
+from sqlalchemy import text as sql_text  # Message.text shadows text()
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
@@ -75,8 +76,14 @@ class Message(Base):
     chat: Mapped["Chat"] = relationship("Chat", back_populates="messages")
     
     __table_args__ = (
-        Index("idx_messages_chat_id", "chat_id"),
-        Index("idx_messages_created_at", "created_at"),
+        # Serves "WHERE chat_id = ? ORDER BY created_at DESC, id DESC" as a
+        # range scan and the chat_id lookup of the cascade delete
+        Index(
+            "idx_messages_chat_created",
+            "chat_id",
+            sql_text("created_at DESC"),
+            sql_text("id DESC"),
+        ),
     )
     
     def __repr__(self) -> str:
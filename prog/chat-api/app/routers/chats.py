@@ -2,7 +2,7 @@
 API endpoints for chat and message operations.
 """
 from typing import Annotated
-from fastapi import APIRouter, Depends, status, Query
+from fastapi import APIRouter, Depends, Response, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
@@ -12,8 +12,11 @@ from app.schemas import (
     ChatWithMessages,
     MessageCreate,
     MessageResponse,
+    encode_chat,
+    encode_chat_with_messages,
+    encode_message,
 )
-from app.services import ChatService
+from app.services import chat_service
 from app.exceptions import ChatNotFoundException
 
 
@@ -30,7 +33,7 @@ router = APIRouter(prefix="/chats", tags=["chats"])
 async def create_chat(
     chat_data: ChatCreate,
     db: Annotated[AsyncSession, Depends(get_db)]
-) -> ChatResponse:
+) -> Response:
     """
     Create a new chat.
     
@@ -44,8 +47,12 @@ async def create_chat(
     Raises:
         422: If title is empty or exceeds 200 characters
     """
-    chat = await ChatService.create_chat(db, chat_data)
-    return ChatResponse.model_validate(chat)
+    chat = await chat_service.create_chat(db, chat_data)
+    return Response(
+        content=encode_chat(chat),
+        status_code=status.HTTP_201_CREATED,
+        media_type="application/json"
+    )
 
 
 @router.post(
@@ -59,7 +66,7 @@ async def create_message(
     chat_id: int,
     message_data: MessageCreate,
     db: Annotated[AsyncSession, Depends(get_db)]
-) -> MessageResponse:
+) -> Response:
     """
     Create a new message in a chat.
     
@@ -75,8 +82,12 @@ async def create_message(
         404: If chat not found
         422: If text is empty or exceeds 5000 characters
     """
-    message = await ChatService.create_message(db, chat_id, message_data)
-    return MessageResponse.model_validate(message)
+    message = await chat_service.create_message(db, chat_id, message_data)
+    return Response(
+        content=encode_message(message),
+        status_code=status.HTTP_201_CREATED,
+        media_type="application/json"
+    )
 
 
 @router.get(
@@ -90,7 +101,7 @@ async def get_chat(
     db: Annotated[AsyncSession, Depends(get_db)],
     limit: Annotated[int, Query(ge=1, le=100, description="Maximum messages to return")] = 20,
     offset: Annotated[int, Query(ge=0, description="Number of messages to skip")] = 0
-) -> ChatWithMessages:
+) -> Response:
     """
     Get chat with messages.
     
@@ -106,8 +117,11 @@ async def get_chat(
     Raises:
         404: If chat not found
     """
-    chat = await ChatService.get_chat_with_messages(db, chat_id, limit, offset)
-    return ChatWithMessages.model_validate(chat)
+    chat = await chat_service.get_chat_with_messages(db, chat_id, limit, offset)
+    return Response(
+        content=encode_chat_with_messages(chat),
+        media_type="application/json"
+    )
 
 
 @router.delete(
@@ -133,6 +147,6 @@ async def delete_chat(
     Raises:
         404: If chat not found
     """
-    deleted = await ChatService.delete_chat(db, chat_id)
+    deleted = await chat_service.delete_chat(db, chat_id)
     if not deleted:
         raise ChatNotFoundException(chat_id)
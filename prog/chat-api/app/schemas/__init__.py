@@ -8,6 +8,11 @@ from app.schemas.chat import (
     MessageCreate,
     MessageResponse,
 )
+from app.schemas.structs import (
+    encode_chat,
+    encode_chat_with_messages,
+    encode_message,
+)
 
 __all__ = [
     "ChatCreate",
@@ -15,4 +20,7 @@ __all__ = [
     "ChatWithMessages",
     "MessageCreate",
     "MessageResponse",
+    "encode_chat",
+    "encode_chat_with_messages",
+    "encode_message",
 ]
@@ -2,41 +2,54 @@
 Pydantic schemas for Chat and Message validation and serialization.
 """
 from datetime import datetime
-from typing import List
-from pydantic import BaseModel, Field, field_validator
+from typing import Annotated, Any, Callable, List
+from pydantic import BaseModel, BeforeValidator, Field
 
 
-class ChatCreate(BaseModel):
-    """Schema for creating a new chat."""
+def _trim_nonempty(field_name: str) -> Callable[[Any], Any]:
+    """
+    Build a validator that trims whitespace and rejects values that are
+    empty after trimming.
     
-    title: str = Field(
-        ...,
-        min_length=1,
-        max_length=200,
-        description="Chat title (1-200 characters)"
-    )
+    Runs before pydantic-core, so length limits apply to the trimmed value.
     
-    @field_validator('title')
-    @classmethod
-    def trim_and_validate_title(cls, v: str) -> str:
-        """
-        Trim whitespace and validate title is not empty after trimming.
+    Args:
+        field_name: Field name used in the error message, e.g. "Title"
         
-        Args:
-            v: Raw title string
-            
-        Returns:
-            Trimmed title
-            
-        Raises:
-            ValueError: If title is empty after trimming
-        """
+    Returns:
+        Validator returning the trimmed string, or the value unchanged if
+        it is not a string
+    """
+    message = f'{field_name} cannot be empty or only whitespace'
+    
+    def validate(v: Any) -> Any:
+        if not isinstance(v, str):
+            return v  # Type errors are reported by pydantic-core
         trimmed = v.strip()
         if not trimmed:
-            raise ValueError('Title cannot be empty or only whitespace')
-        if len(trimmed) > 200:
-            raise ValueError('Title cannot exceed 200 characters')
+            raise ValueError(message)
         return trimmed
+    
+    return validate
+
+
+# Length limits are enforced by pydantic-core; only trimming runs in Python
+ChatTitle = Annotated[
+    str,
+    Field(min_length=1, max_length=200, description="Chat title (1-200 characters)"),
+    BeforeValidator(_trim_nonempty("Title")),
+]
+MessageText = Annotated[
+    str,
+    Field(min_length=1, max_length=5000, description="Message text (1-5000 characters)"),
+    BeforeValidator(_trim_nonempty("Text")),
+]
+
+
+class ChatCreate(BaseModel):
+    """Schema for creating a new chat."""
+    
+    title: ChatTitle
 
 
 class ChatResponse(BaseModel):
@@ -54,34 +67,7 @@ class ChatResponse(BaseModel):
 class MessageCreate(BaseModel):
     """Schema for creating a new message."""
     
-    text: str = Field(
-        ...,
-        min_length=1,
-        max_length=5000,
-        description="Message text (1-5000 characters)"
-    )
-    
-    @field_validator('text')
-    @classmethod
-    def trim_and_validate_text(cls, v: str) -> str:
-        """
-        Trim whitespace and validate text is not empty after trimming.
-        
-        Args:
-            v: Raw text string
-            
-        Returns:
-            Trimmed text
-            
-        Raises:
-            ValueError: If text is empty after trimming
-        """
-        trimmed = v.strip()
-        if not trimmed:
-            raise ValueError('Text cannot be empty or only whitespace')
-        if len(trimmed) > 5000:
-            raise ValueError('Text cannot exceed 5000 characters')
-        return trimmed
+    text: MessageText
 
 
 class MessageResponse(BaseModel):
@@ -0,0 +1,102 @@
+"""
+msgspec structs for encoding API responses.
+
+Mirror the ChatResponse, MessageResponse and ChatWithMessages schemas, but
+are built from ORM objects and encoded to JSON in C, skipping pydantic on
+the response path. Pydantic schemas are still used for request validation
+and OpenAPI documentation.
+"""
+from datetime import datetime
+from typing import TYPE_CHECKING, List
+
+import msgspec
+
+if TYPE_CHECKING:
+    # Annotations only: keeps app.schemas importable without the ORM/database
+    from app.models import Chat, Message
+
+
+class MessageStruct(msgspec.Struct):
+    """Message response body."""
+    
+    id: int
+    chat_id: int
+    text: str
+    created_at: datetime
+
+
+class ChatStruct(msgspec.Struct):
+    """Chat response body without messages."""
+    
+    id: int
+    title: str
+    created_at: datetime
+
+
+class ChatWithMessagesStruct(msgspec.Struct):
+    """Chat response body with messages list."""
+    
+    id: int
+    title: str
+    created_at: datetime
+    messages: List[MessageStruct]
+
+
+_encoder = msgspec.json.Encoder()
+
+
+def _message_struct(message: "Message") -> MessageStruct:
+    return MessageStruct(
+        id=message.id,
+        chat_id=message.chat_id,
+        text=message.text,
+        created_at=message.created_at
+    )
+
+
+def encode_chat(chat: "Chat") -> bytes:
+    """
+    Encode chat without messages to JSON.
+    
+    Args:
+        chat: Chat instance
+        
+    Returns:
+        JSON bytes
+    """
+    return _encoder.encode(
+        ChatStruct(id=chat.id, title=chat.title, created_at=chat.created_at)
+    )
+
+
+def encode_message(message: "Message") -> bytes:
+    """
+    Encode message to JSON.
+    
+    Args:
+        message: Message instance
+        
+    Returns:
+        JSON bytes
+    """
+    return _encoder.encode(_message_struct(message))
+
+
+def encode_chat_with_messages(chat: "Chat") -> bytes:
+    """
+    Encode chat with its loaded messages to JSON.
+    
+    Args:
+        chat: Chat instance with messages attached
+        
+    Returns:
+        JSON bytes
+    """
+    return _encoder.encode(
+        ChatWithMessagesStruct(
+            id=chat.id,
+            title=chat.title,
+            created_at=chat.created_at,
+            messages=[_message_struct(message) for message in chat.messages]
+        )
+    )
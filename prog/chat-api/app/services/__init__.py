@@ -1,6 +1,6 @@
 """
 Business logic services.
 """
-from app.services.chat_service import ChatService
+from app.services import chat_service
 
-__all__ = ["ChatService"]
+__all__ = ["chat_service"]
@@ -2,159 +2,159 @@
 Business logic for chat and message operations.
 Handles database interactions through SQLAlchemy ORM.
 """
-from typing import Optional
-from sqlalchemy import select, delete, desc
+from sqlalchemy import bindparam, insert, select, delete, desc
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import aliased, lazyload
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app.models import Chat, Message
 from app.schemas import ChatCreate, MessageCreate
 from app.exceptions import ChatNotFoundException
 
 
-class ChatService:
-    """Service for managing chats and messages."""
+# PostgreSQL SQLSTATE for foreign_key_violation
+_FOREIGN_KEY_VIOLATION = "23503"
+
+
+# Chat joined with a page of its messages, latest first (id breaks ties
+# between messages created within the same transaction). Built once at
+# import time so construction and cache key generation are not repeated
+# per request; chat_id, limit and offset are bound on execution.
+_messages_page = (
+    select(Message)
+    .where(Message.chat_id == bindparam("chat_id"))
+    .order_by(desc(Message.created_at), desc(Message.id))
+    .limit(bindparam("limit"))
+    .offset(bindparam("offset"))
+    .subquery()
+)
+_page = aliased(Message, _messages_page)
+
+# The outer join keeps the chat row when the page is empty
+_chat_with_messages_query = (
+    select(Chat, _page)
+    .outerjoin(_page, _page.chat_id == Chat.id)
+    .where(Chat.id == bindparam("chat_id"))
+    .order_by(desc(_page.created_at), desc(_page.id))
+    .options(lazyload(Chat.messages))
+)
+
+# Single-row inserts returning the mapped object, bypassing the unit of
+# work; lazyload keeps RETURNING from triggering the selectin loader
+_insert_chat_query = (
+    insert(Chat)
+    .returning(Chat)
+    .options(lazyload(Chat.messages))
+)
+_insert_message_query = (
+    insert(Message)
+    .returning(Message)
+    .options(lazyload(Message.chat))
+)
+
+
+async def create_chat(db: AsyncSession, chat_data: ChatCreate) -> Chat:
+    """
+    Create a new chat.
     
-    @staticmethod
-    async def create_chat(db: AsyncSession, chat_data: ChatCreate) -> Chat:
-        """
-        Create a new chat.
+    Args:
+        db: Database session
+        chat_data: Validated chat creation data
         
-        Args:
-            db: Database session
-            chat_data: Validated chat creation data
-            
-        Returns:
-            Created chat instance
-        """
-        chat = Chat(title=chat_data.title)
-        db.add(chat)
-        await db.flush()
-        await db.refresh(chat)
-        return chat
+    Returns:
+        Created chat instance
+    """
+    result = await db.execute(_insert_chat_query, {"title": chat_data.title})
+    return result.scalar_one()
+
+
+async def get_chat_with_messages(
+    db: AsyncSession,
+    chat_id: int,
+    limit: int = 20,
+    offset: int = 0
+) -> Chat:
+    """
+    Get chat with paginated messages sorted by created_at DESC.
     
-    @staticmethod
-    async def get_chat_by_id(
-        db: AsyncSession,
-        chat_id: int,
-        load_messages: bool = False
-    ) -> Optional[Chat]:
-        """
-        Get chat by ID.
-        
-        Args:
-            db: Database session
-            chat_id: Chat ID
-            load_messages: Whether to load messages relationship
-            
-        Returns:
-            Chat instance or None if not found
-        """
-        query = select(Chat).where(Chat.id == chat_id)
+    Args:
+        db: Database session
+        chat_id: Chat ID
+        limit: Maximum number of messages to return (1-100)
+        offset: Number of messages to skip
         
-        if load_messages:
-            query = query.options(selectinload(Chat.messages))
+    Returns:
+        Chat instance with messages
         
-        result = await db.execute(query)
-        return result.scalar_one_or_none()
+    Raises:
+        ChatNotFoundException: If chat not found
+    """
+    result = await db.execute(
+        _chat_with_messages_query,
+        {"chat_id": chat_id, "limit": limit, "offset": offset}
+    )
+    rows = result.all()
+    if not rows:
+        raise ChatNotFoundException(chat_id)
     
-    @staticmethod
-    async def get_chat_with_messages(
-        db: AsyncSession,
-        chat_id: int,
-        limit: int = 20,
-        offset: int = 0
-    ) -> Chat:
-        """
-        Get chat with paginated messages sorted by created_at DESC.
-        
-        Args:
-            db: Database session
-            chat_id: Chat ID
-            limit: Maximum number of messages to return (1-100)
-            offset: Number of messages to skip
-            
-        Returns:
-            Chat instance with messages
-            
-        Raises:
-            ChatNotFoundException: If chat not found
-        """
-        # First, verify chat exists
-        chat = await ChatService.get_chat_by_id(db, chat_id)
-        if not chat:
-            raise ChatNotFoundException(chat_id)
-        
-        # Get messages separately with pagination and sorting
-        # Sort by created_at DESC to get latest messages first
-        messages_query = (
-            select(Message)
-            .where(Message.chat_id == chat_id)
-            .order_by(desc(Message.created_at))
-            .limit(limit)
-            .offset(offset)
-        )
-        
-        result = await db.execute(messages_query)
-        messages = result.scalars().all()
-        
-        # Manually assign messages to chat (avoiding lazy loading)
-        chat.messages = list(messages)
-        
-        return chat
+    chat = rows[0][0]
+    messages = [message for _, message in rows if message is not None]
     
-    @staticmethod
-    async def create_message(
-        db: AsyncSession,
-        chat_id: int,
-        message_data: MessageCreate
-    ) -> Message:
-        """
-        Create a new message in a chat.
+    # Attach the page without recording a collection change, so the
+    # messages outside of it are not treated as orphans on commit
+    set_committed_value(chat, "messages", messages)
+    
+    return chat
+
+
+async def create_message(
+    db: AsyncSession,
+    chat_id: int,
+    message_data: MessageCreate
+) -> Message:
+    """
+    Create a new message in a chat.
+    
+    Args:
+        db: Database session
+        chat_id: Chat ID
+        message_data: Validated message creation data
         
-        Args:
-            db: Database session
-            chat_id: Chat ID
-            message_data: Validated message creation data
-            
-        Returns:
-            Created message instance
-            
-        Raises:
-            ChatNotFoundException: If chat not found
-        """
-        # Verify chat exists
-        chat = await ChatService.get_chat_by_id(db, chat_id)
-        if not chat:
-            raise ChatNotFoundException(chat_id)
+    Returns:
+        Created message instance
         
-        message = Message(
-            chat_id=chat_id,
-            text=message_data.text
+    Raises:
+        ChatNotFoundException: If chat not found
+    """
+    # Insert optimistically: a missing chat is reported by the
+    # chat_id foreign key instead of a separate SELECT
+    try:
+        result = await db.execute(
+            _insert_message_query,
+            {"chat_id": chat_id, "text": message_data.text}
         )
-        db.add(message)
-        await db.flush()
-        await db.refresh(message)
-        return message
+    except IntegrityError as e:
+        # Only a foreign key violation means the chat is missing; any other
+        # constraint failure is a real error
+        if getattr(e.orig, "sqlstate", None) != _FOREIGN_KEY_VIOLATION:
+            raise
+        raise ChatNotFoundException(chat_id) from None
     
-    @staticmethod
-    async def delete_chat(db: AsyncSession, chat_id: int) -> bool:
-        """
-        Delete chat and all its messages (cascade).
-        
-        Args:
-            db: Database session
-            chat_id: Chat ID
-            
-        Returns:
-            True if chat was deleted, False if not found
-        """
-        # Check if chat exists first
-        chat = await ChatService.get_chat_by_id(db, chat_id)
-        if not chat:
-            return False
+    return result.scalar_one()
+
+
+async def delete_chat(db: AsyncSession, chat_id: int) -> bool:
+    """
+    Delete chat and all its messages (cascade).
+    
+    Args:
+        db: Database session
+        chat_id: Chat ID
         
-        # Delete chat (messages will be deleted automatically due to CASCADE)
-        await db.execute(delete(Chat).where(Chat.id == chat_id))
-        await db.flush()
-        return True
+    Returns:
+        True if chat was deleted, False if not found
+    """
+    # Delete chat (messages will be deleted automatically due to CASCADE)
+    result = await db.execute(delete(Chat).where(Chat.id == chat_id))
+    return result.rowcount > 0
@@ -0,0 +1,3 @@
+"""
+Integration tests: API endpoints against the test database.
+"""
@@ -0,0 +1,234 @@
+"""
+Pytest fixtures for Chat API integration tests.
+Provides test database, client, and common test data.
+"""
+from types import MappingProxyType
+from typing import Any, AsyncGenerator, Generator, List, Mapping
+
+import httpx
+import orjson
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient, ASGITransport
+from sqlalchemy import insert, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+
+from app.main import app
+from app.database import get_db, Base
+from app.models import Chat, Message
+from tests.integration.helpers import (
+    BASE_TEST_DATABASE_URL,
+    TEST_DATABASE_URL,
+    XDIST_WORKER,
+    MessagesFactory,
+)
+
+
+# Create test engine; all tests share the session event loop, so pooled
+# connections can be reused across tests
+test_engine = create_async_engine(
+    TEST_DATABASE_URL,
+    echo=False,
+)
+
+# Create test session factory
+TestAsyncSessionLocal = async_sessionmaker(
+    test_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autocommit=False,
+    autoflush=False,
+)
+
+
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    """
+    Run all async tests in the session event loop, the same loop the
+    session-scoped engine and client fixtures live in. Async fixtures get
+    the session loop from asyncio_default_fixture_loop_scope in pytest.ini.
+    
+    Args:
+        items: Collected test items
+    """
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if pytest_asyncio.is_async_test(item):
+            item.add_marker(session_loop, append=False)
+
+
+async def _create_worker_database() -> None:
+    """
+    Create this xdist worker's test database if it does not exist yet.
+    Connects to the shared test database to issue CREATE DATABASE.
+    """
+    name = TEST_DATABASE_URL.database
+    admin_engine = create_async_engine(
+        BASE_TEST_DATABASE_URL,
+        isolation_level="AUTOCOMMIT",
+    )
+    try:
+        async with admin_engine.connect() as conn:
+            exists = await conn.scalar(
+                text("SELECT 1 FROM pg_database WHERE datname = :name"),
+                {"name": name}
+            )
+            if not exists:
+                await conn.execute(text(f'CREATE DATABASE "{name}"'))
+    finally:
+        await admin_engine.dispose()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def create_schema() -> AsyncGenerator[None, None]:
+    """
+    Create all tables once for the test session and drop them afterwards.
+    
+    Yields:
+        None
+    """
+    if XDIST_WORKER:
+        await _create_worker_database()
+    
+    async with test_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    
+    yield
+    
+    async with test_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+    await test_engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def db_session(create_schema: None) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Create a database session for each test inside an outer transaction.
+    The session works in a SAVEPOINT and the outer transaction is rolled
+    back after the test, so no test data is left behind.
+    
+    Args:
+        create_schema: Ensures tables exist
+        
+    Yields:
+        Database session
+    """
+    async with test_engine.connect() as connection:
+        transaction = await connection.begin()
+        session = TestAsyncSessionLocal(
+            bind=connection,
+            join_transaction_mode="create_savepoint",
+        )
+        
+        yield session
+        
+        await session.close()
+        await transaction.rollback()
+
+
+@pytest_asyncio.fixture
+async def seeded_chat(db_session: AsyncSession) -> Chat:
+    """
+    Insert a chat directly through the test session.
+    
+    Args:
+        db_session: Test database session
+        
+    Returns:
+        Persisted chat
+    """
+    chat = Chat(title="Test Chat")
+    db_session.add(chat)
+    await db_session.flush()
+    return chat
+
+
+@pytest.fixture
+def messages_factory(db_session: AsyncSession) -> MessagesFactory:
+    """
+    Bulk-insert messages for a chat in a single INSERT statement.
+    Messages get increasing ids in the order of the given texts.
+    
+    Args:
+        db_session: Test database session
+        
+    Returns:
+        Async function taking chat_id and a list of message texts
+    """
+    async def create_messages(chat_id: int, texts: List[str]) -> None:
+        await db_session.execute(
+            insert(Message),
+            [{"chat_id": chat_id, "text": text} for text in texts]
+        )
+    
+    return create_messages
+
+
+def _orjson_response_json(self: httpx.Response, **kwargs: Any) -> Any:
+    return orjson.loads(self.content)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _orjson_responses() -> Generator[None, None, None]:
+    """
+    Parse test client response bodies with orjson instead of stdlib json.
+    The app encodes with orjson/msgspec, so both sides use C codecs.
+    
+    Yields:
+        None
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(httpx.Response, "json", _orjson_response_json)
+        yield
+
+
+@pytest_asyncio.fixture(scope="session")
+async def http_client() -> AsyncGenerator[AsyncClient, None]:
+    """
+    Create one in-process HTTP client for the whole test session.
+    
+    Yields:
+        HTTP test client
+    """
+    async with AsyncClient(
+        transport=ASGITransport(app=app),
+        base_url="http://test"
+    ) as ac:
+        yield ac
+
+
+@pytest_asyncio.fixture
+async def client(
+    http_client: AsyncClient,
+    db_session: AsyncSession
+) -> AsyncGenerator[AsyncClient, None]:
+    """
+    Provide the shared test client with the database dependency
+    overridden to use this test's session.
+    
+    Args:
+        http_client: Session-wide HTTP test client
+        db_session: Test database session
+        
+    Yields:
+        HTTP test client
+    """
+    async def override_get_db():
+        yield db_session
+    
+    app.dependency_overrides[get_db] = override_get_db
+    
+    yield http_client
+    
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture(scope="session")
+def sample_chat_data() -> Mapping[str, str]:
+    """Sample data for creating a chat (read-only, shared by all tests)."""
+    return MappingProxyType({"title": "Test Chat"})
+
+
+@pytest.fixture(scope="session")
+def sample_message_data() -> Mapping[str, str]:
+    """Sample data for creating a message (read-only, shared by all tests)."""
+    return MappingProxyType({"text": "Test message"})
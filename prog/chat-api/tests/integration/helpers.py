@@ -0,0 +1,29 @@
+"""
+Shared settings and type aliases for integration tests and their fixtures.
+"""
+import os
+from typing import Awaitable, Callable, List
+
+from sqlalchemy import make_url
+
+from app.config import settings
+
+
+# Test database URL (use separate test database)
+BASE_TEST_DATABASE_URL = make_url(
+    settings.DATABASE_URL.replace("/chatdb", "/chatdb_test")
+)
+
+# Under pytest-xdist each worker process gets its own database
+# (chatdb_test_gw0, chatdb_test_gw1, ...), created on first use
+XDIST_WORKER = os.environ.get("PYTEST_XDIST_WORKER")
+TEST_DATABASE_URL = (
+    BASE_TEST_DATABASE_URL.set(
+        database=f"{BASE_TEST_DATABASE_URL.database}_{XDIST_WORKER}"
+    )
+    if XDIST_WORKER
+    else BASE_TEST_DATABASE_URL
+)
+
+# Signature of the messages_factory fixture: (chat_id, texts)
+MessagesFactory = Callable[[int, List[str]], Awaitable[None]]
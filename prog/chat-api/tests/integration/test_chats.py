@@ -2,63 +2,42 @@
 Integration tests for chat and message API endpoints.
 Tests all CRUD operations and edge cases.
 """
+from typing import Mapping
+
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import func, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Chat, Message
+from app.schemas import MessageCreate
+from app.services import chat_service
+from tests.integration.helpers import MessagesFactory
+
+pytestmark = pytest.mark.integration
+
+# Boundary-length input, built once per module
+_TEXT_5001 = "a" * 5001
 
 
 class TestChatCreation:
     """Tests for POST /chats/ endpoint."""
     
     @pytest.mark.asyncio
-    async def test_create_chat_success(self, client: AsyncClient, sample_chat_data: dict):
+    async def test_create_chat_success(
+        self,
+        client: AsyncClient,
+        sample_chat_data: Mapping[str, str]
+    ):
         """Test successful chat creation."""
-        response = await client.post("/chats/", json=sample_chat_data)
+        response = await client.post("/chats/", json=dict(sample_chat_data))
         
         assert response.status_code == 201
         data = response.json()
         assert data["title"] == sample_chat_data["title"]
         assert "id" in data
         assert "created_at" in data
-    
-    @pytest.mark.asyncio
-    async def test_create_chat_with_whitespace_trimming(self, client: AsyncClient):
-        """Test that title whitespace is trimmed."""
-        response = await client.post("/chats/", json={"title": "  Trimmed Title  "})
-        
-        assert response.status_code == 201
-        data = response.json()
-        assert data["title"] == "Trimmed Title"
-    
-    @pytest.mark.asyncio
-    async def test_create_chat_empty_title(self, client: AsyncClient):
-        """Test chat creation with empty title fails."""
-        response = await client.post("/chats/", json={"title": ""})
-        
-        assert response.status_code == 422
-    
-    @pytest.mark.asyncio
-    async def test_create_chat_whitespace_only_title(self, client: AsyncClient):
-        """Test chat creation with whitespace-only title fails."""
-        response = await client.post("/chats/", json={"title": "   "})
-        
-        assert response.status_code == 422
-    
-    @pytest.mark.asyncio
-    async def test_create_chat_title_too_long(self, client: AsyncClient):
-        """Test chat creation with title exceeding 200 chars fails."""
-        long_title = "a" * 201
-        response = await client.post("/chats/", json={"title": long_title})
-        
-        assert response.status_code == 422
-    
-    @pytest.mark.asyncio
-    async def test_create_chat_title_exactly_200_chars(self, client: AsyncClient):
-        """Test chat creation with title exactly 200 chars succeeds."""
-        exact_title = "a" * 200
-        response = await client.post("/chats/", json={"title": exact_title})
-        
-        assert response.status_code == 201
-        assert len(response.json()["title"]) == 200
 
 
 class TestMessageCreation:
@@ -68,18 +47,16 @@ class TestMessageCreation:
     async def test_create_message_success(
         self,
         client: AsyncClient,
-        sample_chat_data: dict,
-        sample_message_data: dict
+        seeded_chat: Chat,
+        sample_message_data: Mapping[str, str]
     ):
         """Test successful message creation."""
-        # Create chat first
-        chat_response = await client.post("/chats/", json=sample_chat_data)
-        chat_id = chat_response.json()["id"]
+        chat_id = seeded_chat.id
         
         # Create message
         response = await client.post(
             f"/chats/{chat_id}/messages/",
-            json=sample_message_data
+            json=dict(sample_message_data)
         )
         
         assert response.status_code == 201
@@ -89,84 +66,88 @@ class TestMessageCreation:
         assert "id" in data
         assert "created_at" in data
     
-    @pytest.mark.asyncio
-    async def test_create_message_with_whitespace_trimming(
-        self,
-        client: AsyncClient,
-        sample_chat_data: dict
-    ):
-        """Test that message text whitespace is trimmed."""
-        chat_response = await client.post("/chats/", json=sample_chat_data)
-        chat_id = chat_response.json()["id"]
-        
-        response = await client.post(
-            f"/chats/{chat_id}/messages/",
-            json={"text": "  Trimmed Text  "}
-        )
-        
-        assert response.status_code == 201
-        assert response.json()["text"] == "Trimmed Text"
-    
     @pytest.mark.asyncio
     async def test_create_message_nonexistent_chat(
         self,
         client: AsyncClient,
-        sample_message_data: dict
+        sample_message_data: Mapping[str, str]
     ):
         """Test creating message in non-existent chat fails with 404."""
         response = await client.post(
             "/chats/99999/messages/",
-            json=sample_message_data
+            json=dict(sample_message_data)
         )
         
         assert response.status_code == 404
         assert "not found" in response.json()["detail"].lower()
     
     @pytest.mark.asyncio
-    async def test_create_message_empty_text(
+    async def test_create_message_other_integrity_error_not_404(
         self,
-        client: AsyncClient,
-        sample_chat_data: dict
+        db_session: AsyncSession,
+        seeded_chat: Chat
     ):
-        """Test creating message with empty text fails."""
-        chat_response = await client.post("/chats/", json=sample_chat_data)
-        chat_id = chat_response.json()["id"]
-        
-        response = await client.post(
-            f"/chats/{chat_id}/messages/",
-            json={"text": ""}
-        )
-        
-        assert response.status_code == 422
+        """Test that non-FK constraint failures are not reported as 404."""
+        # Bypass validation to hit the NOT NULL constraint on messages.text
+        message_data = MessageCreate.model_construct(text=None)
+        
+        with pytest.raises(IntegrityError):
+            await chat_service.create_message(
+                db_session,
+                seeded_chat.id,
+                message_data
+            )
+
+
+class TestInvalidPayload:
+    """
+    Tests for 422 responses on POST endpoints.
+    Individual validation rules are covered by tests/unit/test_validation.py;
+    these cases check that both kinds of schema error reach the client as 422.
+    """
     
     @pytest.mark.asyncio
-    async def test_create_message_text_too_long(
+    @pytest.mark.parametrize(
+        "path,payload,message",
+        [
+            ("/chats/", {"title": "   "}, "Title cannot be empty"),
+            (
+                "/chats/{chat_id}/messages/",
+                {"text": _TEXT_5001},
+                "String should have at most 5000 characters"
+            ),
+        ],
+        ids=[
+            "chat_whitespace_only_title",
+            "message_text_too_long",
+        ]
+    )
+    async def test_create_rejects_invalid_payload(
         self,
         client: AsyncClient,
-        sample_chat_data: dict
+        seeded_chat: Chat,
+        path: str,
+        payload: dict,
+        message: str
     ):
-        """Test creating message with text exceeding 5000 chars fails."""
-        chat_response = await client.post("/chats/", json=sample_chat_data)
-        chat_id = chat_response.json()["id"]
-        
-        long_text = "a" * 5001
+        """Test that invalid payloads fail with 422 naming the problem."""
         response = await client.post(
-            f"/chats/{chat_id}/messages/",
-            json={"text": long_text}
+            path.format(chat_id=seeded_chat.id),
+            json=payload
         )
         
         assert response.status_code == 422
+        detail = response.json()["detail"]
+        assert any(message in err["msg"] for err in detail)
 
 
 class TestGetChat:
     """Tests for GET /chats/{id} endpoint."""
     
     @pytest.mark.asyncio
-    async def test_get_chat_success(self, client: AsyncClient, sample_chat_data: dict):
+    async def test_get_chat_success(self, client: AsyncClient, seeded_chat: Chat):
         """Test successful chat retrieval."""
-        # Create chat
-        chat_response = await client.post("/chats/", json=sample_chat_data)
-        chat_id = chat_response.json()["id"]
+        chat_id = seeded_chat.id
         
         # Get chat
         response = await client.get(f"/chats/{chat_id}")
@@ -174,7 +155,7 @@ class TestGetChat:
         assert response.status_code == 200
         data = response.json()
         assert data["id"] == chat_id
-        assert data["title"] == sample_chat_data["title"]
+        assert data["title"] == seeded_chat.title
         assert "messages" in data
         assert isinstance(data["messages"], list)
     
@@ -182,20 +163,17 @@ class TestGetChat:
     async def test_get_chat_with_messages(
         self,
         client: AsyncClient,
-        sample_chat_data: dict
+        seeded_chat: Chat,
+        messages_factory: MessagesFactory
     ):
         """Test getting chat with messages."""
-        # Create chat
-        chat_response = await client.post("/chats/", json=sample_chat_data)
-        chat_id = chat_response.json()["id"]
+        chat_id = seeded_chat.id
         
         # Create multiple messages
-        messages = ["First message", "Second message", "Third message"]
-        for text in messages:
-            await client.post(
-                f"/chats/{chat_id}/messages/",
-                json={"text": text}
-            )
+        await messages_factory(
+            chat_id,
+            ["First message", "Second message", "Third message"]
+        )
         
         # Get chat
         response = await client.get(f"/chats/{chat_id}")
@@ -213,18 +191,14 @@ class TestGetChat:
     async def test_get_chat_with_limit(
         self,
         client: AsyncClient,
-        sample_chat_data: dict
+        seeded_chat: Chat,
+        messages_factory: MessagesFactory
     ):
         """Test pagination with limit parameter."""
-        chat_response = await client.post("/chats/", json=sample_chat_data)
-        chat_id = chat_response.json()["id"]
+        chat_id = seeded_chat.id
         
         # Create 5 messages
-        for i in range(5):
-            await client.post(
-                f"/chats/{chat_id}/messages/",
-                json={"text": f"Message {i}"}
-            )
+        await messages_factory(chat_id, [f"Message {i}" for i in range(5)])
         
         # Get chat with limit=2
         response = await client.get(f"/chats/{chat_id}?limit=2")
@@ -236,18 +210,14 @@ class TestGetChat:
     async def test_get_chat_with_offset(
         self,
         client: AsyncClient,
-        sample_chat_data: dict
+        seeded_chat: Chat,
+        messages_factory: MessagesFactory
     ):
         """Test pagination with offset parameter."""
-        chat_response = await client.post("/chats/", json=sample_chat_data)
-        chat_id = chat_response.json()["id"]
+        chat_id = seeded_chat.id
         
         # Create 5 messages
-        for i in range(5):
-            await client.post(
-                f"/chats/{chat_id}/messages/",
-                json={"text": f"Message {i}"}
-            )
+        await messages_factory(chat_id, [f"Message {i}" for i in range(5)])
         
         # Get chat with offset=2
         response = await client.get(f"/chats/{chat_id}?offset=2")
@@ -256,10 +226,9 @@ class TestGetChat:
         assert len(response.json()["messages"]) == 3
     
     @pytest.mark.asyncio
-    async def test_get_chat_limit_validation(self, client: AsyncClient):
+    async def test_get_chat_limit_validation(self, client: AsyncClient, seeded_chat: Chat):
         """Test that limit must be between 1 and 100."""
-        chat_response = await client.post("/chats/", json={"title": "Test"})
-        chat_id = chat_response.json()["id"]
+        chat_id = seeded_chat.id
         
         # Test limit > 100
         response = await client.get(f"/chats/{chat_id}?limit=101")
@@ -282,11 +251,9 @@ class TestDeleteChat:
     """Tests for DELETE /chats/{id} endpoint."""
     
     @pytest.mark.asyncio
-    async def test_delete_chat_success(self, client: AsyncClient, sample_chat_data: dict):
+    async def test_delete_chat_success(self, client: AsyncClient, seeded_chat: Chat):
         """Test successful chat deletion."""
-        # Create chat
-        chat_response = await client.post("/chats/", json=sample_chat_data)
-        chat_id = chat_response.json()["id"]
+        chat_id = seeded_chat.id
         
         # Delete chat
         response = await client.delete(f"/chats/{chat_id}")
@@ -301,23 +268,21 @@ class TestDeleteChat:
     async def test_delete_chat_cascade_messages(
         self,
         client: AsyncClient,
-        sample_chat_data: dict
+        db_session: AsyncSession,
+        seeded_chat: Chat,
+        messages_factory: MessagesFactory
     ):
         """Test that deleting chat also deletes messages (cascade)."""
-        # Create chat
-        chat_response = await client.post("/chats/", json=sample_chat_data)
-        chat_id = chat_response.json()["id"]
+        chat_id = seeded_chat.id
+        count_messages = (
+            select(func.count(Message.id)).where(Message.chat_id == chat_id)
+        )
         
         # Create messages
-        for i in range(3):
-            await client.post(
-                f"/chats/{chat_id}/messages/",
-                json={"text": f"Message {i}"}
-            )
+        await messages_factory(chat_id, [f"Message {i}" for i in range(3)])
         
         # Verify messages exist
-        get_response = await client.get(f"/chats/{chat_id}")
-        assert len(get_response.json()["messages"]) == 3
+        assert await db_session.scalar(count_messages) == 3
         
         # Delete chat
         delete_response = await client.delete(f"/chats/{chat_id}")
@@ -326,6 +291,7 @@ class TestDeleteChat:
         # Verify chat and messages are deleted
         get_response = await client.get(f"/chats/{chat_id}")
         assert get_response.status_code == 404
+        assert await db_session.scalar(count_messages) == 0
     
     @pytest.mark.asyncio
     async def test_delete_chat_nonexistent(self, client: AsyncClient):
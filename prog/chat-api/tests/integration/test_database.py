@@ -0,0 +1,140 @@
+"""
+Integration tests for the get_db session dependency and pool warm-up.
+Every API test overrides get_db, so its commit/rollback logic is tested here.
+"""
+from typing import Awaitable, Callable
+
+import asyncpg
+import pytest
+from sqlalchemy import func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app import database, main
+from app.database import get_db
+from app.config import settings
+from app.models import Chat
+from tests.integration.helpers import TEST_DATABASE_URL
+
+pytestmark = pytest.mark.integration
+
+
+async def _add_unflushed(session: AsyncSession) -> None:
+    session.add(Chat(title="get_db chat"))
+
+
+async def _core_insert(session: AsyncSession) -> None:
+    connection = await session.connection()
+    await connection.execute(insert(Chat).values(title="get_db chat"))
+
+
+class TestGetDb:
+    """Tests for the real get_db dependency."""
+    
+    @pytest.fixture(autouse=True)
+    def bind_to_test_connection(
+        self,
+        db_session: AsyncSession,
+        monkeypatch: pytest.MonkeyPatch
+    ):
+        """
+        Make get_db open its sessions on the test connection. Each session
+        works in a SAVEPOINT, so a commit releases it and leaves the rows
+        visible to db_session, while a missing commit rolls them back.
+        
+        Args:
+            db_session: Test database session
+            monkeypatch: Pytest monkeypatch fixture
+        """
+        monkeypatch.setattr(
+            database,
+            "AsyncSessionLocal",
+            async_sessionmaker(
+                bind=db_session.bind,
+                class_=AsyncSession,
+                expire_on_commit=False,
+                autoflush=False,
+                join_transaction_mode="create_savepoint",
+            )
+        )
+    
+    @staticmethod
+    async def count_chats(db_session: AsyncSession) -> int:
+        return await db_session.scalar(
+            select(func.count(Chat.id)).where(Chat.title == "get_db chat")
+        )
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "write",
+        [_add_unflushed, _core_insert],
+        ids=["unflushed_add", "core_insert"]
+    )
+    async def test_get_db_commits_writes(
+        self,
+        db_session: AsyncSession,
+        write: Callable[[AsyncSession], Awaitable[None]]
+    ):
+        """Test that writes made in the request session are committed."""
+        dependency = get_db()
+        session = await anext(dependency)
+        await write(session)
+        
+        with pytest.raises(StopAsyncIteration):
+            await anext(dependency)
+        
+        assert await self.count_chats(db_session) == 1
+    
+    @pytest.mark.asyncio
+    async def test_get_db_rolls_back_on_error(self, db_session: AsyncSession):
+        """Test that writes are rolled back when the request fails."""
+        dependency = get_db()
+        session = await anext(dependency)
+        await _core_insert(session)
+        
+        with pytest.raises(RuntimeError):
+            await dependency.athrow(RuntimeError("request failed"))
+        
+        assert await self.count_chats(db_session) == 0
+
+
+class TestPoolWarmUp:
+    """Tests for the startup pool warm-up."""
+    
+    @pytest.mark.asyncio
+    async def test_warm_up_fills_pool(self, monkeypatch: pytest.MonkeyPatch):
+        """Test that warm-up leaves pool_size idle connections in the pool."""
+        engine = create_async_engine(
+            TEST_DATABASE_URL,
+            pool_size=settings.DB_POOL_SIZE,
+        )
+        monkeypatch.setattr(database, "engine", engine)
+        
+        try:
+            await database.warm_up_pool()
+            assert engine.pool.checkedin() == settings.DB_POOL_SIZE
+        finally:
+            await engine.dispose()
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "error",
+        [
+            ConnectionRefusedError("connection refused"),
+            asyncpg.InvalidCatalogNameError('database "missing" does not exist'),
+            asyncpg.InvalidAuthorizationSpecificationError('role "missing" does not exist'),
+        ],
+        ids=["connection_refused", "unknown_database", "unknown_role"]
+    )
+    async def test_warm_up_failure_does_not_block_startup(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        error: Exception
+    ):
+        """Test that the app starts even if the pool cannot be warmed up."""
+        async def failing_warm_up() -> None:
+            raise error
+        
+        monkeypatch.setattr(main, "warm_up_pool", failing_warm_up)
+        
+        async with main.lifespan(main.app):
+            pass
@@ -0,0 +1,3 @@
+"""
+Unit tests: pure schema validation, no database or app.
+"""
@@ -0,0 +1,17 @@
+"""
+Pytest fixtures for schema unit tests.
+Imports only the schemas, so these tests run without the app or database.
+"""
+import pytest
+
+from app.schemas import ChatCreate, MessageCreate
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_pydantic() -> None:
+    """
+    Run each request schema through validation once per session so the
+    first validation test does not pay the one-off warm-up cost.
+    """
+    ChatCreate(title="x")
+    MessageCreate(text="x")
@@ -0,0 +1,116 @@
+"""
+Unit tests for Pydantic schema validation.
+Tests edge cases for title and text validation.
+"""
+import pytest
+from pydantic import ValidationError
+
+from app.schemas import ChatCreate, MessageCreate
+
+pytestmark = pytest.mark.unit
+
+# Boundary-length inputs, built once per module
+_TITLE_200 = "a" * 200
+_TITLE_200_PADDED = "  " + _TITLE_200 + "  "
+_TITLE_201 = "a" * 201
+_TEXT_5000 = "a" * 5000
+_TEXT_5000_PADDED = "  " + _TEXT_5000 + "  "
+_TEXT_5001 = "a" * 5001
+
+
+class TestChatCreateValidation:
+    """Unit tests for ChatCreate schema validation."""
+    
+    @pytest.mark.parametrize(
+        "title,expected",
+        [
+            ("Valid Title", "Valid Title"),
+            ("  Trimmed  ", "Trimmed"),
+            ("a", "a"),
+            (_TITLE_200, _TITLE_200),
+            (_TITLE_200_PADDED, _TITLE_200),
+            ("Chat #1: Test! @2024", "Chat #1: Test! @2024"),
+            ("Чат 中文 🚀", "Чат 中文 🚀"),
+        ],
+        ids=[
+            "valid",
+            "trimmed",
+            "min_length",
+            "max_length",
+            "max_length_after_trim",
+            "special_characters",
+            "unicode",
+        ]
+    )
+    def test_chat_valid(self, title: str, expected: str):
+        """Test that valid titles are accepted and trimmed."""
+        chat = ChatCreate(title=title)
+        assert chat.title == expected
+    
+    @pytest.mark.parametrize(
+        "title",
+        ["", "   ", "\t\n  \r\n", _TITLE_201],
+        ids=["empty", "only_spaces", "only_whitespace", "too_long"]
+    )
+    def test_chat_invalid(self, title: str):
+        """Test that invalid titles fail validation."""
+        with pytest.raises(ValidationError):
+            ChatCreate(title=title)
+    
+    def test_empty_title_after_trim(self):
+        """Test that whitespace-only title fails with a title-specific error."""
+        with pytest.raises(ValidationError) as exc_info:
+            ChatCreate(title="   ")
+        
+        errors = exc_info.value.errors()
+        assert any("Title cannot be empty" in err["msg"] for err in errors)
+
+
+class TestMessageCreateValidation:
+    """Unit tests for MessageCreate schema validation."""
+    
+    @pytest.mark.parametrize(
+        "text,expected",
+        [
+            ("Valid message", "Valid message"),
+            ("  Trimmed text  ", "Trimmed text"),
+            ("a", "a"),
+            (_TEXT_5000, _TEXT_5000),
+            (_TEXT_5000_PADDED, _TEXT_5000),
+            ("Line 1\nLine 2\nLine 3", "Line 1\nLine 2\nLine 3"),
+            ("Hello! @user #tag $100 50% <test>", "Hello! @user #tag $100 50% <test>"),
+            ("Привет! 你好! 🎉", "Привет! 你好! 🎉"),
+        ],
+        ids=[
+            "valid",
+            "trimmed",
+            "min_length",
+            "max_length",
+            "max_length_after_trim",
+            "newlines",
+            "special_characters",
+            "unicode",
+        ]
+    )
+    def test_message_valid(self, text: str, expected: str):
+        """Test that valid texts are accepted and trimmed."""
+        message = MessageCreate(text=text)
+        assert message.text == expected
+    
+    @pytest.mark.parametrize(
+        "text",
+        ["", "   ", "\t\n  \r\n", _TEXT_5001],
+        ids=["empty", "only_spaces", "only_whitespace", "too_long"]
+    )
+    def test_message_invalid(self, text: str):
+        """Test that invalid texts fail validation."""
+        with pytest.raises(ValidationError):
+            MessageCreate(text=text)
+    
+    def test_empty_text_after_trim(self):
+        """Test that whitespace-only text fails with a text-specific error."""
+        with pytest.raises(ValidationError) as exc_info:
+            MessageCreate(text="   ")
+        
+        errors = exc_info.value.errors()
+        assert any("Text cannot be empty" in err["msg"] for err in errors)